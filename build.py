@@ -0,0 +1,45 @@
+# Copyright (c) 2022 Robert Bosch GmbH
+# SPDX-License-Identifier: AGPL-3.0
+
+"""
+Build script executed by poetry-core (see [tool.poetry.build] in pyproject.toml).
+Bundles the remote KG schemas into exe_kg_lib/schemata as N-Triples so that built
+packages parse them locally instead of fetching Turtle over HTTP at runtime.
+"""
+
+import importlib.util
+import os
+import sys
+
+SCHEMA_UTILS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "exe_kg_lib", "utils", "schema_utils.py"
+)
+
+
+def _load_schema_utils():
+    # loaded by file path instead of importing exe_kg_lib, whose runtime
+    # dependencies are not installed in the isolated build environment
+    spec = importlib.util.spec_from_file_location("schema_utils", SCHEMA_UTILS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> None:
+    schema_utils = _load_schema_utils()
+    if schema_utils.schemata_bundled():
+        return
+
+    try:
+        schema_utils.bundle_schemata()
+    except Exception as e:
+        # the bundled files are a performance optimization; the package still
+        # works without them by fetching each schema's fallback_path at runtime
+        print(
+            f"Warning: could not bundle KG schemas ({e}), the built package will fetch them at runtime",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
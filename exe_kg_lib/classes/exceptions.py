@@ -0,0 +1,11 @@
+# Copyright (c) 2022 Robert Bosch GmbH
+# SPDX-License-Identifier: AGPL-3.0
+
+
+class TaskParseError(Exception):
+    """
+    Raised when a pipeline task cannot be parsed from the input KG,
+    e.g. because its parent class or method is missing.
+    Callers that execute many pipelines in one process can catch this
+    and continue with the next pipeline instead of losing the process.
+    """
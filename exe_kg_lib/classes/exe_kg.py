@@ -1,11 +1,16 @@
 # Copyright (c) 2022 Robert Bosch GmbH
 # SPDX-License-Identifier: AGPL-3.0
 
+import graphlib
+import hashlib
 import itertools
+import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Union
 
-import pandas as pd
 from rdflib import Literal
 
 from exe_kg_lib.utils.kg_validation_utils import check_kg_executability
@@ -13,101 +18,147 @@ from exe_kg_lib.utils.kg_validation_utils import check_kg_executability
 from ..utils.cli_utils import (get_input_for_existing_data_entities,
                                get_input_for_new_data_entities)
 from ..utils.kg_creation_utils import (add_and_attach_data_entity,
-                                       add_data_entity_instance,
+                                       add_and_attach_referenced_data_entity,
                                        add_instance_from_parent_with_relation,
                                        add_literal, create_pipeline_task,
                                        name_instance)
 from ..utils.query_utils import *
 from ..utils.query_utils import (
-    get_data_properties_plus_inherited_by_class_iri, get_method_by_task_iri,
+    get_data_properties_plus_inherited_by_class_iri, get_ordered_task_iris,
     get_pipeline_and_first_task_iri)
-from ..utils.string_utils import property_name_to_field_name
+from ..utils.schema_utils import KG_SCHEMAS
+from ..utils.string_utils import local_name, property_name_to_field_name
 from .data_entity import DataEntity
 from .entity import Entity
+from .exceptions import TaskParseError
 from .kg_schema import KGSchema
-from .task import Task
-from .tasks import ml_tasks, statistic_tasks, visual_tasks
-
-KG_SCHEMAS = {
-    "Data Science": {
-        "path": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/ds_exeKGOntology.ttl",
-        "namespace": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/ds_exeKGOntology.ttl#",
-        "namespace_prefix": "ds",
-    },
-    "Visualization": {
-        "path": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/visu_exeKGOntology.ttl",
-        "namespace": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/visu_exeKGOntology.ttl#",
-        "namespace_prefix": "visu",
-    },
-    "Statistics": {
-        "path": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/stats_exeKGOntology.ttl",
-        "namespace": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/stats_exeKGOntology.ttl#",
-        "namespace_prefix": "stats",
-    },
-    "Machine Learning": {
-        "path": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/ml_exeKGOntology.ttl",
-        "namespace": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/ml_exeKGOntology.ttl#",
-        "namespace_prefix": "ml",
-    },
-}
+from .task import TASK_CLASSES, Task
+
+PARSE_KGS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "exekg")
+
+# graphs with more triples than this are saved as N-Triples by default, which serializes much faster than Turtle
+LARGE_KG_TRIPLE_THRESHOLD = 10000
+
+# cached URIRef construction, since the same IRIs recur while walking the KG
+cached_uriref = lru_cache(maxsize=4096)(URIRef)
+
+# interned list-field names, compared by identity in the task parsing loop
+_HAS_INPUT_FIELD = sys.intern("has_input")
+_HAS_OUTPUT_FIELD = sys.intern("has_output")
 
 
 class ExeKG:
-    def __init__(self, input_exe_kg_path: str = None):
+    # class-level cache of Entity objects of the top-level KG schema, shared across instances
+    # since the top-level schema is constant (and cached by KGSchema.from_schema_info)
+    _top_level_entity_cache: Dict[str, Entity] = {}
+
+    def __init__(self, input_exe_kg_path: str = None, input_kg_store: str = "default"):
         """
 
         Args:
             input_exe_kg_path: path of KG to be executed
                                acts as switch for KG execution mode (if filled, mode is on)
+            input_kg_store: rdflib store plugin to back self.input_kg with
+                            e.g. "Oxigraph" (needs the "oxigraph" extra) swaps rdflib's pure-Python
+                            triple matching for Oxigraph's native indexes on all lookups
         """
-        self.top_level_schema = KGSchema.from_schema_info(KG_SCHEMAS["Data Science"])  # top-level KG schema
         self.bottom_level_schemata = {}
-
-        # top-level KG schema entities
-        self.atomic_task = Entity(self.top_level_schema.namespace.AtomicTask)
-        self.atomic_method = Entity(self.top_level_schema.namespace.AtomicMethod)
-        self.data_entity = Entity(self.top_level_schema.namespace.DataEntity)
-        self.pipeline = Entity(self.top_level_schema.namespace.Pipeline)
-        self.data = Entity(self.top_level_schema.namespace.Data)
-        self.data_semantics = Entity(self.top_level_schema.namespace.DataSemantics)
-        self.data_structure = Entity(self.top_level_schema.namespace.DataStructure)
+        # bottom-level schema infos that have not been loaded yet (KG construction mode loads them lazily)
+        self._pending_schema_infos = {}
 
         # self.input_kg: KG eventually filled with 3 KG schemas and the input executable KG in case of KG execution
-        self.input_kg = Graph(bind_namespaces="rdflib")
-        if input_exe_kg_path:  # KG execution mode
-            self.input_kg.parse(input_exe_kg_path, format="n3")  # parse input executable KG
-            check_kg_executability(self.input_kg)
-            all_ns = [n for n in self.input_kg.namespace_manager.namespaces()]
-            bottom_level_schema_info_set = False  # flag indicating that a bottom-level schema was found
-            for schema_name, schema_info in KG_SCHEMAS.items():  # search for used bottom-level schema
-                if (
-                    schema_name == "Data Science"  # or schema_name == "Visualization"
-                ):  # skip top-level KG schema and Visualization schema that is always used
-                    continue
-
-                if (schema_info["namespace_prefix"], URIRef(schema_info["namespace"])) in all_ns:
-                    # bottom-level schema found
-                    self.bottom_level_schemata[schema_info["namespace_prefix"]] = KGSchema.from_schema_info(schema_info)
-                    bottom_level_schema_info_set = True
-
-            if not bottom_level_schema_info_set:  # no bottom-level schema found, input executable KG is invalid
-                print("Input executable KG did not have any bottom level KG schemas")
-                exit(1)
-        else:  # KG construction mode
-            for schema_name, schema_info in KG_SCHEMAS.items():  # search for used bottom-level schema
-                if (
-                    schema_name == "Data Science"  # or schema_name == "Visualization"
-                ):  # skip top-level KG schema and Visualization schema that is always used
-                    continue
-
-                self.bottom_level_schemata[schema_info["namespace_prefix"]] = KGSchema.from_schema_info(schema_info)
+        self.input_kg = Graph(store=input_kg_store, bind_namespaces="rdflib")
+
+        # the schema builds and the input executable KG parse are independent and partly I/O-bound,
+        # so they are overlapped in a thread pool
+        with ThreadPoolExecutor(max_workers=len(KG_SCHEMAS)) as executor:
+            input_kg_parse_future = (
+                executor.submit(self.input_kg.parse, input_exe_kg_path, format="n3") if input_exe_kg_path else None
+            )
+            top_level_schema_future = executor.submit(KGSchema.from_schema_info, KG_SCHEMAS["Data Science"])
+
+            bottom_level_schema_futures = {}
+            if not input_exe_kg_path:  # KG construction mode
+                # defer the bottom-level schema builds until a task of theirs is actually requested,
+                # so that e.g. a pure ML pipeline never loads the Visualization schema
+                for schema_name, schema_info in KG_SCHEMAS.items():
+                    if (
+                        schema_name == "Data Science"  # or schema_name == "Visualization"
+                    ):  # skip top-level KG schema and Visualization schema that is always used
+                        continue
+
+                    self._pending_schema_infos[schema_info["namespace_prefix"]] = schema_info
+
+            self.top_level_schema = top_level_schema_future.result()  # top-level KG schema
+
+            if input_exe_kg_path:  # KG execution mode
+                input_kg_parse_future.result()  # wait for input executable KG parse
+                check_kg_executability(self.input_kg)
+                # set of (prefix, namespace) pairs for O(1) membership checks, without re-wrapping URIRefs per schema
+                all_ns = {
+                    (prefix, str(namespace_iri))
+                    for prefix, namespace_iri in self.input_kg.namespace_manager.namespaces()
+                }
+                for schema_name, schema_info in KG_SCHEMAS.items():  # search for used bottom-level schema
+                    if (
+                        schema_name == "Data Science"  # or schema_name == "Visualization"
+                    ):  # skip top-level KG schema and Visualization schema that is always used
+                        continue
+
+                    if (schema_info["namespace_prefix"], schema_info["namespace"]) in all_ns:
+                        # bottom-level schema found
+                        bottom_level_schema_futures[schema_info["namespace_prefix"]] = executor.submit(
+                            KGSchema.from_schema_info, schema_info
+                        )
+
+                if not bottom_level_schema_futures:  # no bottom-level schema found, input executable KG is invalid
+                    print("Input executable KG did not have any bottom level KG schemas")
+                    exit(1)
+
+            for namespace_prefix, schema_future in bottom_level_schema_futures.items():
+                self.bottom_level_schemata[namespace_prefix] = schema_future.result()
+
+        # top-level KG schema entities, created lazily on first instantiation and shared afterwards
+        entity_cache = ExeKG._top_level_entity_cache
+        if not entity_cache:
+            for class_name in (
+                "AtomicTask",
+                "AtomicMethod",
+                "DataEntity",
+                "Pipeline",
+                "Data",
+                "DataSemantics",
+                "DataStructure",
+            ):
+                entity_cache[class_name] = Entity(getattr(self.top_level_schema.namespace, class_name))
+        self.atomic_task = entity_cache["AtomicTask"]
+        self.atomic_method = entity_cache["AtomicMethod"]
+        self.data_entity = entity_cache["DataEntity"]
+        self.pipeline = entity_cache["Pipeline"]
+        self.data = entity_cache["Data"]
+        self.data_semantics = entity_cache["DataSemantics"]
+        self.data_structure = entity_cache["DataStructure"]
+
+        # task-linking relations, resolved once; self._relation_iri tracks which one the next task needs:
+        # hasStartTask right after pipeline creation, hasNextTask for every task after the first
+        self._start_task_relation_iri = self.top_level_schema.namespace.hasStartTask
+        self._next_task_relation_iri = self.top_level_schema.namespace.hasNextTask
+        self._relation_iri = self._start_task_relation_iri
+
+        # schema terms used per parsed data entity, resolved once here since every
+        # Namespace attribute access concatenates and wraps a fresh URIRef
+        self._data_entity_class_iri = self.top_level_schema.namespace.DataEntity
+        self._has_reference_iri = self.top_level_schema.namespace.hasReference
 
         bottom_level_schemata_kgs = [kg_schema.kg for kg_schema in self.bottom_level_schemata.values()]
 
-        self.input_kg += self.top_level_schema.kg  # + self.visu_schema.kg  # combine all KG schemas in input KG
+        # combine all KG schemas in input KG, one bulk addN() insertion per schema
+        # instead of Graph.__iadd__, which funnels every triple through extra Python-level plumbing
+        for kg_schema_kg in [self.top_level_schema.kg] + bottom_level_schemata_kgs:
+            self.input_kg.addN((s, p, o, self.input_kg) for s, p, o in kg_schema_kg)
 
-        for bottom_level_schema_kg in bottom_level_schemata_kgs:
-            self.input_kg += bottom_level_schema_kg
+        # materialize the rdfs:subClassOf closure once, so that all later subclass lookups are direct triple matches
+        materialize_subclass_closure(self.input_kg)
 
         self.output_kg = Graph(bind_namespaces="rdflib")  # KG to be filled while constructing executable KG
 
@@ -122,6 +173,17 @@ class ExeKG:
         self.data_semantics_list = []  # list for storing the available sub-classes of ds:DataSemantics
         self.data_structure_list = []  # list for storing the available sub-classes of ds:DataStructure
 
+        # lazily-filled indexes over the read-only input KG, to avoid re-querying per created task
+        self._methods_by_task = {}  # task class IRI -> dict of method local name -> (method property IRI, method class IRI)
+        self._data_props_by_method = {}  # method class IRI -> rows of (data property IRI, range IRI)
+        self._inputs_cache = {}  # task class IRI -> rows of (input property IRI, input class IRI, data structure IRI)
+        self._outputs_cache = {}  # task class IRI -> rows of (output property IRI, output class IRI, data structure IRI)
+        self._parsed_tasks_cache = {}  # task IRI -> parsed Task object, for repeated pipeline executions
+        self._task_parent_index = None  # task IRI -> parent task class IRI, built by self._build_task_indexes()
+        self._task_method_index = None  # task IRI -> method Entity, built by self._build_task_indexes()
+        self._parent_task_cache = {}  # task class IRI -> shared parent Task wrapper used during parsing
+        self._field_name_by_predicate = None  # predicate IRI -> snake-case field name, built by self._build_task_indexes()
+
         self.existing_data_entity_list = (
             []
         )  # contains existing data entities that are output entities of previous tasks during KG construction
@@ -147,41 +209,202 @@ class ExeKG:
                     bottom_level_kg_schema.namespace,
                 )
 
+    def _get_bottom_level_schema(self, namespace_prefix: str) -> KGSchema:
+        """
+        Retrieves the bottom-level KG schema with the given namespace prefix, loading it first if it is still pending
+        On a lazy load, the schema is merged into self.input_kg, the subclass closure is re-materialized,
+        the namespaces are re-bound and the schema-dependent lists and indexes are refreshed
+        Args:
+            namespace_prefix: prefix of the namespace of the KG schema to retrieve
+
+        Returns:
+            KGSchema: object corresponding to the given namespace prefix
+        """
+        kg_schema = self.bottom_level_schemata.get(namespace_prefix)
+        if kg_schema is not None:
+            return kg_schema
+
+        kg_schema = KGSchema.from_schema_info(self._pending_schema_infos.pop(namespace_prefix))
+        self.bottom_level_schemata[namespace_prefix] = kg_schema
+
+        self.input_kg.addN((s, p, o, self.input_kg) for s, p, o in kg_schema.kg)
+        materialize_subclass_closure(self.input_kg)
+        self._bind_used_namespaces([self.input_kg, self.output_kg])
+
+        # refresh everything derived from the input KG
+        self._methods_by_task.clear()
+        self._data_props_by_method.clear()
+        self._inputs_cache.clear()
+        self._outputs_cache.clear()
+        self._parsed_tasks_cache.clear()
+        self._task_parent_index = None
+        self._task_method_index = None
+        self._parent_task_cache.clear()
+        self._field_name_by_predicate = None
+        self._parse_kgs()
+
+        return kg_schema
+
+    def _parse_kgs_cache_path(self) -> str:
+        """
+        Computes the path of the cache file corresponding to the used KG schemas
+        The cache key is derived from the schemas' content fingerprints, so any change in a
+        schema's triples — local, packaged or remote — results in a different cache file
+        Returns:
+            str: path of the cache file
+        """
+        fingerprint_parts = [self.top_level_schema.fingerprint]
+        for kg_schema in self.bottom_level_schemata.values():
+            fingerprint_parts.append(kg_schema.fingerprint)
+
+        fingerprint = hashlib.sha256("|".join(sorted(fingerprint_parts)).encode()).hexdigest()
+        return os.path.join(PARSE_KGS_CACHE_DIR, f"{fingerprint}.json")
+
+    def _load_parse_kgs_cache(self, cache_path: str) -> bool:
+        """
+        Fills the lists and dicts that are normally filled by self._parse_kgs() with the contents of the given cache file
+        Entity objects are rebuilt from the cached IRIs to keep the cache file small
+        Args:
+            cache_path: path of the cache file to load
+
+        Returns:
+            bool: True if the cache file was loaded successfully, False otherwise
+        """
+        try:
+            with open(cache_path) as f:
+                cached_iris = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        for iri in cached_iris["atomic_task_list"]:
+            task = Entity(iri, self.atomic_task)
+            self.atomic_task_list.append(task)
+            self.task_type_dict.setdefault(task.name, 1)
+
+        for iri in cached_iris["atomic_method_list"]:
+            method = Entity(iri, self.atomic_method)
+            self.atomic_method_list.append(method)
+            self.method_type_dict.setdefault(method.name, 1)
+
+        self.data_type_list = [Entity(iri, self.data_entity) for iri in cached_iris["data_type_list"]]
+        self.data_semantics_list = [Entity(iri, self.data_semantics) for iri in cached_iris["data_semantics_list"]]
+        self.data_structure_list = [Entity(iri, self.data_structure) for iri in cached_iris["data_structure_list"]]
+
+        return True
+
+    def _save_parse_kgs_cache(self, cache_path: str) -> None:
+        """
+        Saves the IRIs of the entities gathered by self._parse_kgs() to the given cache file
+        Args:
+            cache_path: path of the cache file to write
+        """
+        cached_iris = {
+            "atomic_task_list": [str(task.iri) for task in self.atomic_task_list],
+            "atomic_method_list": [str(method.iri) for method in self.atomic_method_list],
+            "data_type_list": [str(data_type.iri) for data_type in self.data_type_list],
+            "data_semantics_list": [str(data_semantics.iri) for data_semantics in self.data_semantics_list],
+            "data_structure_list": [str(data_structure.iri) for data_structure in self.data_structure_list],
+        }
+        try:
+            os.makedirs(PARSE_KGS_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "w") as f:
+                json.dump(cached_iris, f)
+        except OSError:  # cache is best-effort, so a non-writable cache dir is not an error
+            pass
+
     def _parse_kgs(self) -> None:
         """
         Fills lists with subclasses of top-level KG schema classes and initializes dicts used for unique naming
+        The gathered entity IRIs only depend on the used KG schemas, so they are cached on disk
+        and the SPARQL queries are skipped when a cache file for the schema combination exists
+        May be re-run when a bottom-level schema is lazily loaded: the lists are rebuilt from scratch,
+        while existing naming counters in the dicts are kept
         """
+        self.atomic_task_list = []
+        self.atomic_method_list = []
+        self.data_type_list = []
+        self.data_semantics_list = []
+        self.data_structure_list = []
+
+        cache_path = self._parse_kgs_cache_path()
+        if self._load_parse_kgs_cache(cache_path):
+            return
+
         atomic_task_subclasses = get_subclasses_of(self.atomic_task.iri, self.input_kg)
-        for t in list(atomic_task_subclasses):
+        for t in atomic_task_subclasses:
             task = Entity(t[0], self.atomic_task)
             self.atomic_task_list.append(task)
-            self.task_type_dict[task.name] = 1
+            self.task_type_dict.setdefault(task.name, 1)
 
         atomic_method_subclasses = get_subclasses_of(self.atomic_method.iri, self.input_kg)
-        for m in list(atomic_method_subclasses):
+        for m in atomic_method_subclasses:
             method = Entity(m[0], self.atomic_method)
             self.atomic_method_list.append(method)
-            self.method_type_dict[method.name] = 1
+            self.method_type_dict.setdefault(method.name, 1)
 
         data_type_subclasses = get_subclasses_of(self.data_entity.iri, self.input_kg)
-        for d in list(data_type_subclasses):
+        for d in data_type_subclasses:
             data_type = Entity(d[0], self.data_entity)
             self.data_type_list.append(data_type)
 
         data_semantics_subclasses = get_subclasses_of(self.data_semantics.iri, self.top_level_schema.kg)
-        for d in list(data_semantics_subclasses):
+        for d in data_semantics_subclasses:
             if d[0] == self.data_entity.iri:
                 continue
             data_semantics = Entity(d[0], self.data_semantics)
             self.data_semantics_list.append(data_semantics)
 
         data_structure_subclasses = get_subclasses_of(self.data_structure.iri, self.top_level_schema.kg)
-        for d in list(data_structure_subclasses):
+        for d in data_structure_subclasses:
             if d[0] == self.data_entity.iri:
                 continue
             data_structure = Entity(d[0], self.data_structure)
             self.data_structure_list.append(data_structure)
 
+        self._save_parse_kgs_cache(cache_path)
+
+    def _get_task_methods(self, task_parent_iri: str) -> Dict[str, Tuple[URIRef, URIRef]]:
+        """
+        Retrieves the methods that are compatible with the given task class, together with their connecting properties
+        Results are cached on first use since self.input_kg is read-only after initialization
+        Args:
+            task_parent_iri: IRI of the task class to search methods for
+
+        Returns:
+            Dict[str, Tuple[URIRef, URIRef]]: keys -> method local names
+                                              values -> pairs of method property IRI and method class IRI
+        """
+        methods = self._methods_by_task.get(task_parent_iri)
+        if methods is None:
+            methods = {
+                local_name(method_iri): (property_iri, method_iri)
+                for property_iri, method_iri in get_method_properties_and_methods(
+                    self.input_kg,
+                    self.top_level_schema.namespace_prefix,
+                    task_parent_iri,
+                )
+            }
+            self._methods_by_task[task_parent_iri] = methods
+
+        return methods
+
+    def _get_method_data_properties(self, method_parent_iri: str) -> List:
+        """
+        Retrieves the data properties (plus the inherited ones) of the given method class
+        Results are cached on first use since self.input_kg is read-only after initialization
+        Args:
+            method_parent_iri: IRI of the method class to search data properties for
+
+        Returns:
+            List: contains rows of data property IRIs and their range
+        """
+        data_properties = self._data_props_by_method.get(method_parent_iri)
+        if data_properties is None:
+            data_properties = get_data_properties_plus_inherited_by_class_iri(self.input_kg, method_parent_iri)
+            self._data_props_by_method[method_parent_iri] = data_properties
+
+        return data_properties
+
     def create_pipeline_task(self, pipeline_name: str, input_data_path: str) -> Task:
         """
         Instantiates and adds a new pipeline task entity to self.output_kg
@@ -200,6 +423,7 @@ class ExeKG:
             input_data_path,
         )
         self.last_created_task = pipeline
+        self._relation_iri = self._start_task_relation_iri  # the next created task is the pipeline's start task
         return pipeline
 
     def create_data_entity(
@@ -251,74 +475,64 @@ class ExeKG:
         Returns:
             Task: object of the created task
         """
-        kg_schema_to_use = self.bottom_level_schemata[kg_schema_short]
+        kg_schema_to_use = self._get_bottom_level_schema(kg_schema_short)
 
-        relation_iri = (
-            self.top_level_schema.namespace.hasNextTask
-            if self.last_created_task.type != "Pipeline"
-            else self.top_level_schema.namespace.hasStartTask
-        )  # use relation depending on the previous task
+        relation_iri = self._relation_iri  # hasStartTask for the first task, hasNextTask afterwards
 
         # instantiate task and link it with the previous one
         parent_task = Task(kg_schema_to_use.namespace + task, self.atomic_task)
+        task_instance_name, task_type_index = name_instance(self.task_type_dict, self.method_type_dict, parent_task)
         added_entity = add_instance_from_parent_with_relation(
             kg_schema_to_use.namespace,
             self.output_kg,
             parent_task,
             relation_iri,
             self.last_created_task,
-            name_instance(self.task_type_dict, self.method_type_dict, parent_task),
+            task_instance_name,
         )
         next_task = Task.from_entity(added_entity)  # create Task object from Entity object
 
         # instantiate and add given input data entities to the task
-        self._add_inputs_to_task(kg_schema_to_use.namespace, next_task, input_data_entity_dict)
+        self._add_inputs_to_task(kg_schema_to_use.namespace, next_task, task_type_index, input_data_entity_dict)
         # instantiate and add output data entities to the task, as specified in the KG schema
-        self._add_outputs_to_task(next_task)
+        self._add_outputs_to_task(next_task, task_type_index)
 
         method_parent = Entity(kg_schema_to_use.namespace + method, self.atomic_method)
 
-        # fetch compatible methods and their properties from KG schema
-        results = list(
-            get_method_properties_and_methods(
-                self.input_kg,
-                self.top_level_schema.namespace_prefix,
-                next_task.parent_entity.iri,
-            )
-        )
-
-        chosen_property_method = next(
-            filter(lambda pair: pair[1].split("#")[1] == method, results), None
-        )  # match given method_type with query result
+        # fetch compatible methods and their properties from the cached KG schema index
+        chosen_property_method = self._get_task_methods(next_task.parent_entity.iri).get(method)
         if chosen_property_method is None:
             print(f"Property connecting task of type {task} with method of type {method} not found")
             exit(1)
 
         # instantiate method and link it with the task using the appropriate chosen_property_method[0] relation
+        method_instance_name, _ = name_instance(self.task_type_dict, self.method_type_dict, method_parent)
         method_entity = add_instance_from_parent_with_relation(
             kg_schema_to_use.namespace,
             self.output_kg,
             method_parent,
             chosen_property_method[0],
             next_task,
-            name_instance(self.task_type_dict, self.method_type_dict, method_parent),
+            method_instance_name,
         )
 
-        # fetch compatible data properties from KG schema
-        property_list = get_data_properties_plus_inherited_by_class_iri(self.input_kg, method_parent.iri)
-
-        # add data properties to the task with given values
-        for pair in property_list:
-            property_iri = pair[0]
-            property_name = property_iri.split("#")[1]
-            range_iri = pair[1]
-            input_property = Literal(
-                lexical_or_value=properties_dict[property_name],
-                datatype=range_iri,
+        # fetch compatible data properties from the cached KG schema index
+        property_list = self._get_method_data_properties(method_parent.iri)
+
+        # add data properties to the method with given values, in one batched insertion
+        property_quads = [
+            (
+                method_entity.iri,
+                property_iri,
+                Literal(lexical_or_value=properties_dict[local_name(property_iri)], datatype=range_iri),
+                self.output_kg,
             )
-            add_literal(self.output_kg, method_entity, property_iri, input_property)
+            for property_iri, range_iri in property_list
+        ]
+        self.output_kg.addN(property_quads)
 
         self.last_created_task = next_task  # store created task
+        self._relation_iri = self._next_task_relation_iri  # subsequent tasks link with hasNextTask
 
         return next_task
 
@@ -326,6 +540,7 @@ class ExeKG:
         self,
         namespace: Namespace,
         task_entity: Task,
+        task_type_index: int,
         input_data_entity_dict: Dict[str, List[DataEntity]] = None,
     ) -> None:
         """
@@ -333,26 +548,33 @@ class ExeKG:
         if input_data_entity_dict is None, user is asked to specify input data entities
         Args:
             task_entity: the task to add the input to
+            task_type_index: numeric index used in the task's instance name
             input_data_entity_dict: keys -> input entity names corresponding to the given task as defined in the chosen bottom-level KG schema
                                     values -> list of corresponding data entities to be added as input to the task
         """
 
         use_cli = input_data_entity_dict is None
 
-        # fetch compatible inputs from KG schema
-        results = list(
-            get_input_properties_and_inputs(
+        # hoist repeatedly-accessed attributes out of the loops below
+        top_level_schema_namespace = self.top_level_schema.namespace
+        top_level_kg = self.top_level_schema.kg
+        has_input_iri = top_level_schema_namespace.hasInput
+        output_kg = self.output_kg
+        data = self.data
+        data_entity_parent = self.data_entity
+
+        # fetch compatible inputs from KG schema, caching per task class since the schema is immutable
+        results = self._inputs_cache.get(task_entity.parent_entity.iri)
+        if results is None:
+            results = get_input_properties_and_inputs(
                 self.input_kg,
                 self.top_level_schema.namespace_prefix,
                 task_entity.parent_entity.iri,
             )
-        )
+            self._inputs_cache[task_entity.parent_entity.iri] = results
 
-        # task_type_index was incremented when creating the task entity
-        # reset the index to match the currently created task's index
-        task_type_index = self.task_type_dict[task_entity.type] - 1
         for _, input_entity_iri, data_structure_iri in results:
-            input_entity_name = input_entity_iri.split("#")[1]
+            input_entity_name = local_name(input_entity_iri)
             if not use_cli:
                 input_data_entity_list = input_data_entity_dict[input_entity_name]
             else:
@@ -363,79 +585,80 @@ class ExeKG:
                     self.data_semantics_list,
                     self.data_structure_list,
                     namespace,
-                    self.data_entity,
+                    data_entity_parent,
                 )
 
             same_input_index = 1
             for input_data_entity in input_data_entity_list:
                 # instantiate data entity corresponding to the found input_entity_name
                 data_entity_iri = input_entity_iri + str(task_type_index) + "_" + str(same_input_index)
-                # instantiate given data entity
-                add_data_entity_instance(
-                    self.output_kg,
-                    self.data,
-                    self.top_level_schema.kg,
-                    self.top_level_schema.namespace,
-                    input_data_entity,
-                )
-                # instantiate and attach data entity with reference to the given data entity
+                # instantiate the given data entity plus a data entity referencing it,
+                # and attach the latter to the task, all in one batched insertion
                 data_entity = DataEntity(
                     data_entity_iri,
-                    DataEntity(input_entity_iri, self.data_entity),
+                    DataEntity(input_entity_iri, data_entity_parent),
                     has_reference=input_data_entity.iri,
                     has_data_structure_iri=data_structure_iri,
                 )
-                add_and_attach_data_entity(
-                    self.output_kg,
-                    self.data,
-                    self.top_level_schema.kg,
-                    self.top_level_schema.namespace,
+                add_and_attach_referenced_data_entity(
+                    output_kg,
+                    data,
+                    top_level_kg,
+                    top_level_schema_namespace,
+                    input_data_entity,
                     data_entity,
-                    self.top_level_schema.namespace.hasInput,
+                    has_input_iri,
                     task_entity,
                 )
                 task_entity.input_dict[input_entity_name] = data_entity
                 same_input_index += 1
 
                 if use_cli:
-                    check_kg_executability(self.output_kg)
+                    check_kg_executability(output_kg)
 
-    def _add_outputs_to_task(self, task_entity: Task) -> None:
+    def _add_outputs_to_task(self, task_entity: Task, task_type_index: int) -> None:
         """
         Instantiates and adds output data entities to the given task of self.output_kg, based on the task's definition in the KG schema
         Args:
             task_entity: the task to add the output to
+            task_type_index: numeric index used in the task's instance name
         """
-        # fetch compatible outputs from KG schema
-        results = list(
-            get_output_properties_and_outputs(
+        # hoist repeatedly-accessed attributes out of the loop below
+        top_level_schema_namespace = self.top_level_schema.namespace
+        top_level_kg = self.top_level_schema.kg
+        has_output_iri = top_level_schema_namespace.hasOutput
+        output_kg = self.output_kg
+        data = self.data
+        data_entity_parent = self.data_entity
+
+        # fetch compatible outputs from KG schema, caching per task class since the schema is immutable
+        results = self._outputs_cache.get(task_entity.parent_entity.iri)
+        if results is None:
+            results = get_output_properties_and_outputs(
                 self.input_kg,
                 self.top_level_schema.namespace_prefix,
                 task_entity.parent_entity.iri,
             )
-        )
+            self._outputs_cache[task_entity.parent_entity.iri] = results
 
-        # task_type_index was incremented when creating the task entity
-        # reset the index to match the currently created task's index
-        task_type_index = self.task_type_dict[task_entity.type] - 1
         for output_property, output_parent_entity_iri, data_structure_iri in results:
             # instantiate and add data entity
             output_data_entity_iri = output_parent_entity_iri + str(task_type_index)
             output_data_entity = DataEntity(
                 output_data_entity_iri,
-                DataEntity(output_parent_entity_iri, self.data_entity),
+                DataEntity(output_parent_entity_iri, data_entity_parent),
                 has_data_structure_iri=data_structure_iri,
             )
             add_and_attach_data_entity(
-                self.output_kg,
-                self.data,
-                self.top_level_schema.kg,
-                self.top_level_schema.namespace,
+                output_kg,
+                data,
+                top_level_kg,
+                top_level_schema_namespace,
                 output_data_entity,
-                self.top_level_schema.namespace.hasOutput,
+                has_output_iri,
                 task_entity,
             )
-            task_entity.output_dict[output_parent_entity_iri.split("#")[1]] = output_data_entity
+            task_entity.output_dict[local_name(output_parent_entity_iri)] = output_data_entity
             self.existing_data_entity_list.append(output_data_entity)
 
     def _create_next_task_cli(self) -> Union[None, Task]:
@@ -459,30 +682,28 @@ class ExeKG:
             return None
 
         next_task_parent = self.atomic_task_list[next_task_id]
-        relation_iri = (
-            self.top_level_schema.namespace.hasNextTask
-            if self.last_created_task.type != "Pipeline"
-            else self.top_level_schema.namespace.hasStartTask
-        )  # use relation depending on the previous task
+        relation_iri = self._relation_iri  # hasStartTask for the first task, hasNextTask afterwards
 
         # instantiate task and link it with the previous one
+        task_instance_name, task_type_index = name_instance(self.task_type_dict, self.method_type_dict, next_task_parent)
         task_entity = add_instance_from_parent_with_relation(
             next_task_parent.namespace,
             self.output_kg,
             next_task_parent,
             relation_iri,
             self.last_created_task,
-            name_instance(self.task_type_dict, self.method_type_dict, next_task_parent),
+            task_instance_name,
         )
 
         task_entity = Task(task_entity.iri, task_entity.parent_entity)  # create Task object from Entity object's info
 
         # instantiate and add input data entities to the task based on user input
-        self._add_inputs_to_task(next_task_parent.namespace, task_entity)
+        self._add_inputs_to_task(next_task_parent.namespace, task_entity, task_type_index)
         # instantiate and add output data entities to the task, as specified in the KG schema
-        self._add_outputs_to_task(task_entity)
+        self._add_outputs_to_task(task_entity, task_type_index)
 
         self.last_created_task = task_entity
+        self._relation_iri = self._next_task_relation_iri  # subsequent tasks link with hasNextTask
         if task_entity.type == "CanvasTask":
             self.canvas_task_created = True
 
@@ -496,20 +717,13 @@ class ExeKG:
         """
         print(f"Please choose a method for {task_to_attach_to.type}:")
 
-        # fetch compatible methods and their properties from KG schema
-        results = list(
-            get_method_properties_and_methods(
-                self.input_kg,
-                self.top_level_schema.namespace_prefix,
-                task_to_attach_to.parent_entity.iri,
-            )
-        )
-        for i, pair in enumerate(results):
-            tmp_method = pair[1].split("#")[1]
-            print(f"\t{str(i)}. {tmp_method}")
+        # fetch compatible methods and their properties from the cached KG schema index
+        methods = self._get_task_methods(task_to_attach_to.parent_entity.iri)
+        for i, method_name in enumerate(methods):
+            print(f"\t{str(i)}. {method_name}")
 
         method_id = int(input())
-        selected_property_and_method = results[method_id]
+        selected_property_and_method = list(methods.values())[method_id]
         method_parent = next(
             filter(
                 lambda m: m.iri == selected_property_and_method[1],
@@ -518,30 +732,31 @@ class ExeKG:
             None,
         )
         # instantiate method and link it with the task using the appropriate selected_property_and_method[0] relation
+        method_instance_name, _ = name_instance(self.task_type_dict, self.method_type_dict, method_parent)
         add_instance_from_parent_with_relation(
             task_to_attach_to.namespace,
             self.output_kg,
             method_parent,
             selected_property_and_method[0],
             task_to_attach_to,
-            name_instance(self.task_type_dict, self.method_type_dict, method_parent),
+            method_instance_name,
         )
 
-        # fetch compatible data properties from KG schema
-        property_list = get_data_properties_plus_inherited_by_class_iri(self.input_kg, method_parent.iri)
+        # fetch compatible data properties from the cached KG schema index
+        property_list = self._get_method_data_properties(method_parent.iri)
 
         if property_list:
             print(f"Please enter requested properties for {method_parent.name}:")
-            # add data properties to the task with given values
-            for pair in property_list:
-                property_instance = URIRef(pair[0])
-                range = pair[1].split("#")[1]
-                range_iri = pair[1]
+            # collect data properties with the given values and add them in one batched insertion
+            property_quads = []
+            for property_iri, range_iri in property_list:
+                range = local_name(range_iri)
                 input_property = Literal(
-                    lexical_or_value=input("\t{} in range({}): ".format(pair[0].split("#")[1], range)),
+                    lexical_or_value=input("\t{} in range({}): ".format(local_name(property_iri), range)),
                     datatype=range_iri,
                 )
-                add_literal(self.output_kg, task_to_attach_to, property_instance, input_property)
+                property_quads.append((task_to_attach_to.iri, property_iri, input_property, self.output_kg))
+            self.output_kg.addN(property_quads)
 
         check_kg_executability(self.output_kg)
 
@@ -552,6 +767,10 @@ class ExeKG:
             pipeline_name: name for the pipeline
             input_data_path: path for the input data to be used by the pipeline's tasks
         """
+        # the CLI lists the tasks of every schema, so any still-pending bottom-level schema is needed now
+        for namespace_prefix in list(self._pending_schema_infos):
+            self._get_bottom_level_schema(namespace_prefix)
+
         pipeline = create_pipeline_task(
             self.top_level_schema.namespace,
             self.pipeline,
@@ -561,6 +780,7 @@ class ExeKG:
         )
 
         self.last_created_task = pipeline
+        self._relation_iri = self._start_task_relation_iri  # the next created task is the pipeline's start task
 
         while True:
             next_task = self._create_next_task_cli()
@@ -569,39 +789,48 @@ class ExeKG:
 
             self._create_method(next_task)
 
-    def save_created_kg(self, file_path: str) -> None:
+    def save_created_kg(self, file_path: str, format: str = None) -> None:
         """
         Saves self.output_kg to a file
         Args:
             file_path: path of the output file
+            format: serialization format passed to rdflib
+                    defaults to the fast line-based N-Triples for large graphs and Turtle otherwise
         """
         check_kg_executability(self.output_kg)
 
         dir_path = os.path.dirname(file_path)
         os.makedirs(dir_path, exist_ok=True)
 
-        self.output_kg.serialize(destination=file_path)
+        if format is None:
+            format = "nt" if len(self.output_kg) > LARGE_KG_TRIPLE_THRESHOLD else "turtle"
+
+        if format == "nt":  # rdflib requires an explicit encoding for N-Triples destinations
+            self.output_kg.serialize(destination=file_path, format=format, encoding="utf-8")
+        else:
+            self.output_kg.serialize(destination=file_path, format=format)
         print(f"Executable KG saved in {file_path}")
 
-    def _property_value_to_field_value(self, property_value: str) -> Union[str, DataEntity]:
+    def _property_value_to_field_value(self, property_value) -> Union[str, DataEntity]:
         """
         Converts property value to Python class field value
-        If property_value is not a data entity's IRI, it is returned as is
+        If property_value is not a data entity's IRI, it is returned as a string
         Else, its property values are converted recursively and stored in a DataEntity object
         Args:
-            property_value: value of the property as found in KG
+            property_value: value of the property as found in KG, as an rdflib node or plain string
 
         Returns:
-            str: property_value parameter as is
+            str: lexical form of the property_value parameter
             DataEntity: object containing parsed data entity properties
         """
-        if "#" in property_value:
-            data_entity = self._parse_data_entity_by_iri(property_value)
-            if data_entity is None:
-                return property_value
-            return data_entity
+        # literals can never be data entity IRIs, skip the substring scan for them
+        # URIRef is a str sub-class, so the "#" check below needs no conversion
+        if not isinstance(property_value, Literal) and "#" in property_value:
+            data_entity = self._parse_data_entity_by_iri(str(property_value))
+            if data_entity is not None:
+                return data_entity
 
-        return property_value
+        return str(property_value)
 
     def _parse_data_entity_by_iri(self, in_out_data_entity_iri: str) -> Optional[DataEntity]:
         """
@@ -613,131 +842,287 @@ class ExeKG:
             None: if given IRI does not belong to an instance of a sub-class of self.top_level_schema.namespace.DataEntity
             DataEntity: object with data entity's parsed properties
         """
-        # fetch type of entity with given IRI
-        query_result = get_first_query_result_if_exists(
-            query_entity_parent_iri,
-            self.input_kg,
-            in_out_data_entity_iri,
-            self.top_level_schema.namespace.DataEntity,
-        )
-        if query_result is None:
-            return None
+        data_entity_uriref = cached_uriref(in_out_data_entity_iri)
+        top_level_data_entity_iri = self._data_entity_class_iri
+
+        # fetch type of entity with given IRI, directly from the KG's triples
+        # the materialized subclass closure makes the sub-class check a single triple lookup
+        data_entity_parent_iri = None
+        for type_iri in self.input_kg.objects(data_entity_uriref, RDF.type):
+            if (
+                type_iri == top_level_data_entity_iri
+                or (type_iri, RDFS.subClassOf, top_level_data_entity_iri) in self.input_kg
+            ):
+                data_entity_parent_iri = str(type_iri)
+                break
 
-        data_entity_parent_iri = str(query_result[0])
+        if data_entity_parent_iri is None:
+            return None
 
         # fetch IRI of data entity that is referenced by the given entity
-        query_result = get_first_query_result_if_exists(
-            query_data_entity_reference_iri,
-            self.input_kg,
-            self.top_level_schema.namespace_prefix,
-            in_out_data_entity_iri,
-        )
+        reference_iri = next(self.input_kg.objects(data_entity_uriref, self._has_reference_iri), None)
 
-        if query_result is None:  # no referenced data entity found
+        if reference_iri is None:  # no referenced data entity found
             data_entity_ref_iri = in_out_data_entity_iri
         else:
-            data_entity_ref_iri = str(query_result[0])
+            data_entity_ref_iri = str(reference_iri)
 
         # create DataEntity object to store all the parsed properties
         data_entity = DataEntity(in_out_data_entity_iri, Entity(data_entity_parent_iri))
-        data_entity.has_reference = data_entity_ref_iri.split("#")[1]
+        data_entity.has_reference = local_name(data_entity_ref_iri)
 
-        for s, p, o in self.input_kg.triples((URIRef(data_entity_ref_iri), None, None)):
-            # parse property name and value
-            field_name = property_name_to_field_name(str(p))
+        for s, p, o in self.input_kg.triples((cached_uriref(data_entity_ref_iri), None, None)):
+            # parse property name and value (URIRef is a str sub-class, so no str() allocation is needed)
+            field_name = property_name_to_field_name(p)
             if not hasattr(data_entity, field_name) or field_name == "type":
                 continue
-            field_value = self._property_value_to_field_value(str(o))
+            field_value = self._property_value_to_field_value(o)
             setattr(data_entity, field_name, field_value)  # set field value dynamically
 
         return data_entity
 
-    def _parse_task_by_iri(self, task_iri: str, canvas_method: visual_tasks.CanvasTaskCanvasMethod = None) -> Task:
+    def _build_task_indexes(self) -> None:
+        """
+        Builds the task-instance indexes used by self._parse_task_by_iri in one pass over self.input_kg:
+        task IRI -> parent task class IRI, and task IRI -> method Entity
+        This turns the two per-task lookups into dict accesses; the subclass checks rely on the
+        materialized rdfs:subClassOf closure
+        """
+        namespace = self.top_level_schema.namespace
+        atomic_task_iri = namespace.AtomicTask
+        atomic_method_iri = namespace.AtomicMethod
+
+        self._task_parent_index = {}
+        for class_iri in [atomic_task_iri] + list(self.input_kg.subjects(RDFS.subClassOf, atomic_task_iri)):
+            for instance_iri in self.input_kg.subjects(RDF.type, class_iri):
+                self._task_parent_index[str(instance_iri)] = str(class_iri)
+
+        # resolve the sub-properties of hasMethod with a small worklist,
+        # since only the rdfs:subClassOf closure is materialized
+        method_properties = {namespace.hasMethod}
+        worklist = [namespace.hasMethod]
+        while worklist:
+            property_iri = worklist.pop()
+            for sub_property_iri in self.input_kg.subjects(RDFS.subPropertyOf, property_iri):
+                if sub_property_iri not in method_properties:
+                    method_properties.add(sub_property_iri)
+                    worklist.append(sub_property_iri)
+
+        self._task_method_index = {}
+        for property_iri in method_properties:
+            for task_iri, method_iri in self.input_kg.subject_objects(property_iri):
+                for type_iri in self.input_kg.objects(method_iri, RDF.type):
+                    if type_iri == atomic_method_iri or (type_iri, RDFS.subClassOf, atomic_method_iri) in self.input_kg:
+                        self._task_method_index[str(task_iri)] = Entity(str(method_iri), Entity(str(type_iri)))
+                        break
+
+        # convert every distinct predicate of the KG to its field name once,
+        # so the per-triple dispatch in self._parse_task_by_iri is a plain dict probe
+        self._field_name_by_predicate = {
+            predicate_iri: property_name_to_field_name(predicate_iri)
+            for predicate_iri in set(self.input_kg.predicates())
+        }
+
+    def _parse_task_by_iri(
+        self,
+        task_iri: str,
+        canvas_method: "visual_tasks.CanvasTaskCanvasMethod" = None,
+        property_rows: List[Tuple] = None,
+    ) -> Task:
         """
         Parses a task of self.input_kg and stores the info in an object of a sub-class of Task
         The sub-class name and the object's fields are mapped dynamically based on the found KG components
         Args:
             task_iri: IRI of the task to be parsed
             canvas_method: optional object to pass as argument for task object initialization
+            property_rows: optional pre-fetched (predicate, object) rows of the task, to skip the index probe
 
         Returns:
             Task: object of a sub-class of Task, containing all the parsed info
         """
-        # fetch type of entity with given IRI
-        query_result = get_first_query_result_if_exists(
-            query_entity_parent_iri,
-            self.input_kg,
-            task_iri,
-            self.top_level_schema.namespace.AtomicTask,
-        )
+        # deferred so that importing the library does not pay for pandas/sklearn/matplotlib,
+        # which the task modules pull in transitively; importing them fills TASK_CLASSES
+        from .tasks import ml_tasks, statistic_tasks, visual_tasks
+
+        # reuse the parsed object on repeated executions of an unchanged KG
+        # the cache is cleared whenever a new bottom-level schema is merged into self.input_kg
+        cached_task = self._parsed_tasks_cache.get(task_iri)
+        if cached_task is not None:
+            return cached_task
+
+        if self._task_parent_index is None:
+            self._build_task_indexes()
 
+        # fetch type of entity with given IRI
+        task_parent_iri = self._task_parent_index.get(task_iri)
         if (
-            query_result is None
+            task_parent_iri is None
         ):  # given IRI does not belong to an instance of a sub-class of self.top_level_schema.namespace.AtomicTask
-            print(f"Cannot retrieve parent of task with iri {task_iri}. Exiting...")
-            exit(1)
+            raise TaskParseError(f"Cannot retrieve parent of task with iri {task_iri}")
 
-        task_parent_iri = str(query_result[0])
+        # share one parent Task wrapper per task class instead of allocating one per parse
+        parent_task = self._parent_task_cache.get(task_parent_iri)
+        if parent_task is None:
+            parent_task = self._parent_task_cache.setdefault(task_parent_iri, Task(task_parent_iri))
 
-        task = Task(task_iri, Task(task_parent_iri))
-        method = get_method_by_task_iri(
-            self.input_kg,
-            self.top_level_schema.namespace_prefix,
-            self.top_level_schema.namespace,
-            task_iri,
-        )
+        method = self._task_method_index.get(task_iri)
         if method is None:
-            print(f"Cannot retrieve method for task with iri: {task_iri}")
+            raise TaskParseError(f"Cannot retrieve method for task with iri: {task_iri}")
 
         # perform automatic mapping of KG task class to Python sub-class
-        class_name = task.type + method.type
-        Class = getattr(visual_tasks, class_name, None)
+        # every Task sub-class registers itself in TASK_CLASSES at definition time,
+        # so the lookup is one dict probe instead of a getattr ladder over the task modules
+        class_name = parent_task.name + method.type
+        Class = TASK_CLASSES.get(class_name)
         if Class is None:
-            Class = getattr(statistic_tasks, class_name, None)
-        if Class is None:
-            Class = getattr(ml_tasks, class_name, None)
+            raise TaskParseError(f"No Task class registered for {class_name}")
 
         # create Task sub-class object
         if canvas_method:
-            task = Class(task_iri, Task(task_parent_iri), canvas_method)
+            task = Class(task_iri, parent_task, canvas_method)
         else:
-            task = Class(task_iri, Task(task_parent_iri))
-
-        task_related_triples = self.input_kg.triples((URIRef(task_iri), None, None))
-        method_related_triples = self.input_kg.triples((URIRef(method.iri), None, None))
-
-        for s, p, o in itertools.chain(task_related_triples, method_related_triples):
-            # parse property name and value
-            field_name = property_name_to_field_name(str(p))
-            if not hasattr(task, field_name) or field_name == "type":
+            task = Class(task_iri, parent_task)
+
+        # compute the settable fields once instead of calling hasattr() per triple
+        task_fields = set(vars(task))
+        task_fields.discard("type")
+
+        if property_rows is None:
+            property_rows = self.input_kg.predicate_objects(cached_uriref(task_iri))
+        method_related_pairs = self.input_kg.predicate_objects(cached_uriref(method.iri))
+
+        # bind the attribute accessors once, so the loop below does not re-resolve them per triple
+        has_input_append = task.has_input.append
+        has_output_append = task.has_output.append
+        set_field = task.__setattr__
+        property_value_to_field_value = self._property_value_to_field_value
+        field_name_by_predicate = self._field_name_by_predicate
+
+        for p, o in itertools.chain(property_rows, method_related_pairs):
+            # look up the predicate's field name in the per-KG map built by self._build_task_indexes()
+            field_name = field_name_by_predicate.get(p)
+            if field_name is None or field_name not in task_fields:
                 continue
-            field_value = self._property_value_to_field_value(str(o))
+            field_value = property_value_to_field_value(o)
 
             # set field value dynamically
-            if field_name == "has_input" or field_name == "has_output":
-                getattr(task, field_name).append(field_value)
+            # identity checks are safe here: field names come out of property_name_to_field_name
+            # interned, and source-code literals are interned by CPython
+            if field_name is _HAS_INPUT_FIELD:
+                has_input_append(field_value)
+            elif field_name is _HAS_OUTPUT_FIELD:
+                has_output_append(field_value)
             else:
-                setattr(task, field_name, field_value)
+                set_field(field_name, field_value)
 
+        # canvas-bound tasks carry matplotlib state (the canvas task its created figure, plot
+        # tasks their canvas reference), so they are re-created per execution instead of cached,
+        # keeping each run's plots bound to that run's freshly created figure
+        if canvas_method is None and parent_task.name != "CanvasTask":
+            self._parsed_tasks_cache[task_iri] = task
         return task
 
     def execute_pipeline(self):
         """
         Retrieves and executes pipeline by parsing self.input_kg
         """
+        import pandas as pd  # deferred, pandas import is heavy and only needed for execution
+
         pipeline_iri, input_data_path, next_task_iri = get_pipeline_and_first_task_iri(
             self.input_kg, self.top_level_schema.namespace_prefix
         )
-        input_data = pd.read_csv(input_data_path, delimiter=",", encoding="ISO-8859-1")
+
+        try:
+            import pyarrow.csv as pyarrow_csv  # optional columnar CSV reader, installed via the "arrow" extra
+        except ImportError:
+            pyarrow_csv = None
+
+        # restrict the CSV parse to the columns that the pipeline's data entities reference
+        # via hasSource, so the reader skips parsing and storing the unused ones
+        source_columns = {str(source) for source in self.input_kg.objects(None, self.top_level_schema.namespace.hasSource)}
+
+        if pyarrow_csv is not None:
+            import pyarrow
+
+            # memory-map the file so the reader works on OS page-cache pages instead of copied buffers
+            try:
+                csv_source = pyarrow.memory_map(input_data_path)
+            except OSError:  # e.g. non-regular file, fall back to buffered reads
+                csv_source = input_data_path
+
+            # parse into columnar Arrow buffers and convert to pandas without copying,
+            # so the column Series handed to tasks alias one contiguous array each
+            convert_options = pyarrow_csv.ConvertOptions(include_columns=sorted(source_columns)) if source_columns else None
+            arrow_table = pyarrow_csv.read_csv(
+                csv_source,
+                read_options=pyarrow_csv.ReadOptions(encoding="ISO-8859-1"),
+                parse_options=pyarrow_csv.ParseOptions(delimiter=","),
+                convert_options=convert_options,
+            )
+            input_data = arrow_table.to_pandas(split_blocks=True, self_destruct=True)
+        else:
+            read_csv_kwargs = {"delimiter": ",", "encoding": "ISO-8859-1", "engine": "c"}
+            if source_columns:
+                read_csv_kwargs["usecols"] = lambda column: column in source_columns
+            input_data = pd.read_csv(input_data_path, **read_csv_kwargs)
+        # resolve the whole pipeline's task order up-front with one walk over the
+        # hasNextTask links, instead of re-deriving it from each parsed task
+        task_iris = get_ordered_task_iris(self.input_kg, self.top_level_schema.namespace, next_task_iri)
+
+        # batch-fetch every task's property rows before the run loop, so parsing
+        # dispatches over in-memory lists instead of probing the KG mid-execution
+        property_rows_by_task = {
+            task_iri: list(self.input_kg.predicate_objects(cached_uriref(task_iri))) for task_iri in task_iris
+        }
+
+        # parse all tasks before running any, tracking which of them share the plotting canvas
         canvas_method = None  # stores Task object that corresponds to a task of type CanvasTask
-        task_output_dict = {}  # gradually filled with outputs of executed tasks
-        while next_task_iri is not None:
-            next_task = self._parse_task_by_iri(next_task_iri, canvas_method)
-            output = next_task.run_method(task_output_dict, input_data)
-            if output:
-                task_output_dict.update(output)
+        tasks = []
+        uses_canvas = []
+        for task_iri in task_iris:
+            next_task = self._parse_task_by_iri(task_iri, canvas_method, property_rows_by_task[task_iri])
+            tasks.append(next_task)
+            uses_canvas.append(canvas_method is not None or next_task.type == "CanvasTask")
 
             if next_task.type == "CanvasTask":
                 canvas_method = next_task
 
-            next_task_iri = next_task.has_next_task
+        # build the dependency DAG: a task depends on the tasks that produce its referenced inputs
+        producer_index_by_output = {}
+        for task_index, pipeline_task in enumerate(tasks):
+            for output in pipeline_task.has_output:
+                producer_index_by_output[output.name] = task_index
+
+        dependencies = {task_index: set() for task_index in range(len(tasks))}
+        for task_index, pipeline_task in enumerate(tasks):
+            for input in pipeline_task.has_input:
+                producer_index = producer_index_by_output.get(input.has_reference)
+                if producer_index is not None and producer_index != task_index:
+                    dependencies[task_index].add(producer_index)
+
+        # tasks drawing on the shared canvas mutate matplotlib state, so keep them in pipeline order
+        # via synthetic dependencies between consecutive canvas users
+        canvas_task_indexes = [task_index for task_index, used in enumerate(uses_canvas) if used]
+        for previous_index, task_index in zip(canvas_task_indexes, canvas_task_indexes[1:]):
+            dependencies[task_index].add(previous_index)
+
+        # run the tasks in topological order, executing independent ones concurrently
+        sorter = graphlib.TopologicalSorter(dependencies)
+        sorter.prepare()
+        task_output_dict = {}  # gradually filled with outputs of executed tasks
+        with ThreadPoolExecutor() as executor:
+            while sorter.is_active():
+                ready_indexes = sorter.get_ready()
+                if len(ready_indexes) == 1:
+                    outputs = [tasks[ready_indexes[0]].run_method(task_output_dict, input_data)]
+                else:
+                    outputs = list(
+                        executor.map(
+                            lambda task_index: tasks[task_index].run_method(task_output_dict, input_data),
+                            ready_indexes,
+                        )
+                    )
+                for output in outputs:
+                    if output:
+                        task_output_dict.update(output)
+                sorter.done(*ready_indexes)
@@ -1,24 +1,79 @@
 # Copyright (c) 2022 Robert Bosch GmbH
 # SPDX-License-Identifier: AGPL-3.0
 
-from typing import Dict
+import hashlib
+import importlib.resources
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from rdflib import Graph, Namespace
 
+PACKAGED_SCHEMA_PREFIX = "pkg://"  # marks a schema path as a resource bundled inside the package
+
 
 class KGSchema:
     """
     Stores a Graph object and some metadata corresponding to a KG schema
     """
 
-    def __init__(self, path: str, namespace: str, namespace_prefix: str):
-        self.path = path  # path of the KG schema definition, can be local or remote
+    def __init__(self, path: str, namespace: str, namespace_prefix: str, fallback_path: str = None):
+        self.path = path  # path of the KG schema definition, can be local, remote or packaged (pkg:// prefix)
+        self.fallback_path = fallback_path  # optional path to parse when the packaged schema file is missing
         self.namespace = Namespace(namespace)
         self.namespace_prefix = namespace_prefix
 
         self.kg = Graph(bind_namespaces="rdflib")
-        self.kg.parse(self.path, format="n3")
+        schema_text = self._read_packaged_schema(path) if path.startswith(PACKAGED_SCHEMA_PREFIX) else None
+        if schema_text is not None:
+            # bundled schemas are stored as N-Triples, which rdflib parses much faster than Turtle
+            self.kg.parse(data=schema_text, format="nt")
+            fingerprint_source = schema_text
+        else:
+            self.kg.parse(self.fallback_path or self.path, format="n3")
+            # the lines are sorted since rdflib's serialization order is not stable across processes
+            fingerprint_source = "\n".join(sorted(self.kg.serialize(format="nt").splitlines()))
+
+        # content hash of the schema, used to key caches derived from it
+        self.fingerprint = hashlib.sha256(fingerprint_source.encode()).hexdigest()
+
+    @staticmethod
+    def _read_packaged_schema(path: str) -> Optional[str]:
+        """
+        Reads a schema file bundled inside the package
+        Args:
+            path: packaged schema path of the form pkg://<package>/<file name>
+
+        Returns:
+            str: content of the schema file
+            None: if the schema file is not bundled in the package
+        """
+        package_name, _, resource_name = path[len(PACKAGED_SCHEMA_PREFIX) :].partition("/")
+        try:
+            return importlib.resources.read_text(package_name, resource_name)
+        except FileNotFoundError:
+            return None
 
     @classmethod
     def from_schema_info(cls, schema_info: Dict[str, str]):
-        return cls(schema_info["path"], schema_info["namespace"], schema_info["namespace_prefix"])
+        """
+        Creates a KGSchema based on the given schema info
+        Repeated calls with equal schema info return the same cached object,
+        which is safe to share since a KGSchema is read-only after construction
+        Args:
+            schema_info: contains the paths, namespace and namespace prefix of the schema
+
+        Returns:
+            KGSchema: object corresponding to the given schema info
+        """
+        return cls._from_frozen_schema_info(tuple(sorted(schema_info.items())))
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _from_frozen_schema_info(cls, frozen_schema_info: Tuple[Tuple[str, str], ...]):
+        schema_info = dict(frozen_schema_info)
+        return cls(
+            schema_info["path"],
+            schema_info["namespace"],
+            schema_info["namespace_prefix"],
+            schema_info.get("fallback_path"),
+        )
@@ -1,14 +1,21 @@
 # Copyright (c) 2022 Robert Bosch GmbH
 # SPDX-License-Identifier: AGPL-3.0
 
+from __future__ import annotations
+
 from abc import abstractmethod
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-import numpy as np
-import pandas as pd
+if TYPE_CHECKING:  # numpy and pandas are only needed for type hints here, keep the module import light
+    import numpy as np
+    import pandas as pd
 
 from .entity import Entity
 
+# maps Python class names to Task sub-classes, filled automatically by Task.__init_subclass__
+# lets the KG-class-to-Python-class mapping during parsing be a single dict lookup
+TASK_CLASSES: Dict[str, type] = {}
+
 
 class Task(Entity):
     """
@@ -20,6 +27,10 @@ class Task(Entity):
     This is necessary for automatically mapping KG properties to Python object fields while parsing the KG.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        TASK_CLASSES[cls.__name__] = cls
+
     def __init__(
         self,
         iri: str,
@@ -29,8 +29,7 @@ class CanvasTaskCanvasMethod(Task):
 class PlotTask(Task):
     def __init__(self, iri: str, parent_entity: Entity, canvas_method: CanvasTaskCanvasMethod):
         super().__init__(iri, parent_entity)
-        self.fig = canvas_method.fig
-        self.grid = canvas_method.grid
+        self.canvas_method = canvas_method
 
         self.has_legend_name = None
         self.has_layout = None
@@ -41,6 +40,16 @@ class PlotTask(Task):
         self.has_line_style = None
         self.has_line_width = 1
 
+    # the canvas task creates its figure and grid when it runs, which may be after this
+    # task is constructed, so both are read from it at plotting time instead of being copied here
+    @property
+    def fig(self):
+        return self.canvas_method.fig
+
+    @property
+    def grid(self):
+        return self.canvas_method.grid
+
     @abstractmethod
     def run_method(self, *args):
         raise NotImplementedError
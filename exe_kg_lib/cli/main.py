@@ -9,14 +9,18 @@ from distutils.dir_util import copy_tree
 import typer
 
 from exe_kg_lib import ExeKG
+from exe_kg_lib.classes.exceptions import TaskParseError
 from exe_kg_lib.utils.cli_utils import input_pipeline_info
 
 app = typer.Typer(name="ML pipeline creation and execution", no_args_is_help=True)
 
 
 @app.command()
-def create_pipeline():
-    pipeline_name, input_data_path = input_pipeline_info()
+def create_pipeline(
+    pipeline_name: str = typer.Option(None, help="Name for the pipeline, prompted for if omitted."),
+    input_data_path: str = typer.Option(None, help="Path for the input data, prompted for if omitted."),
+):
+    pipeline_name, input_data_path = input_pipeline_info(pipeline_name, input_data_path)
 
     exe_kg = ExeKG()
     exe_kg.start_pipeline_creation(pipeline_name, input_data_path)
@@ -26,7 +30,11 @@ def create_pipeline():
 @app.command()
 def run_pipeline(path: str):
     exe_kg = ExeKG(input_exe_kg_path=path)
-    exe_kg.execute_pipeline()
+    try:
+        exe_kg.execute_pipeline()
+    except TaskParseError as e:
+        print(f"Error: {e}")
+        raise typer.Exit(code=1)
 
 
 @app.command()
@@ -0,0 +1,8 @@
+# Copyright (c) 2022 Robert Bosch GmbH
+# SPDX-License-Identifier: AGPL-3.0
+
+"""
+Contains the KG schemas bundled with the package as N-Triples files.
+The files are generated from the remote Turtle schemas by build.py at package build time
+(and can be refreshed manually via the "bundle-schemata" poe task).
+"""
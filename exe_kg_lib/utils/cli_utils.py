@@ -1,6 +1,7 @@
 # Copyright (c) 2022 Robert Bosch GmbH
 # SPDX-License-Identifier: AGPL-3.0
 
+import os
 from typing import List, Tuple
 
 from rdflib import Namespace
@@ -78,13 +79,27 @@ def get_input_for_new_data_entities(
     return data_entities
 
 
-def input_pipeline_info() -> Tuple[str, str]:
+def input_pipeline_info(pipeline_name: str = None, input_data_path: str = None) -> Tuple[str, str]:
     """
-    Asks user to provide a name for the pipeline and a path for the input data
+    Resolves a name for the pipeline and a path for the input data
+    Values not given as arguments are taken from the EXEKG_PIPELINE_NAME and
+    EXEKG_INPUT_DATA_PATH environment variables; the user is only prompted for
+    what remains unresolved, so batch invocations never block on stdin
+    Args:
+        pipeline_name: pre-resolved pipeline name, skips the prompt if filled
+        input_data_path: pre-resolved input data path, skips the prompt if filled
+
     Returns:
-        Tuple[str, str]: contains the provided strings
+        Tuple[str, str]: contains the resolved strings
     """
-    pipeline_name = input("Enter a name for the pipeline: ")
-    input_data_path = input("Enter a path for the input data: ")
+    if pipeline_name is None:
+        pipeline_name = os.environ.get("EXEKG_PIPELINE_NAME")
+    if input_data_path is None:
+        input_data_path = os.environ.get("EXEKG_INPUT_DATA_PATH")
+
+    if pipeline_name is None:
+        pipeline_name = input("Enter a name for the pipeline: ")
+    if input_data_path is None:
+        input_data_path = input("Enter a path for the input data: ")
 
     return pipeline_name, input_data_path
@@ -1,7 +1,7 @@
 # Copyright (c) 2022 Robert Bosch GmbH
 # SPDX-License-Identifier: AGPL-3.0
 
-from typing import Dict, Union
+from typing import Dict, List, Tuple, Union
 
 from rdflib import RDF, XSD, Graph, Literal, Namespace, URIRef
 
@@ -87,7 +87,7 @@ def name_instance(
     task_type_dict: Dict[str, int],
     method_type_dict: Dict[str, int],
     parent_entity: Entity,
-) -> Union[None, str]:
+) -> Tuple[Union[None, str], Union[None, int]]:
     """
     Creates a unique name for a new instance by concatenating the parent entity's name (which is the instance type) with a number
     Also increments the relevant number of the corresponding dict
@@ -97,8 +97,8 @@ def name_instance(
         parent_entity: instance's parent entity
 
     Returns:
-        str: name to be given to the new instance
-        None: if the type of the given parent entity is not equal with "AtomicTask" or "AtomicMethod"
+        Tuple[str, int]: name to be given to the new instance, and the numeric index used in it
+        Tuple[None, None]: if the type of the given parent entity is not equal with "AtomicTask" or "AtomicMethod"
     """
     if parent_entity.type == "AtomicTask":
         entity_type_dict = task_type_dict
@@ -106,30 +106,35 @@ def name_instance(
         entity_type_dict = method_type_dict
     else:
         print("Error: Invalid parent entity type")
-        return None
+        return None, None
 
-    instance_name = parent_entity.name + str(entity_type_dict[parent_entity.name])
-    entity_type_dict[parent_entity.name] += 1
-    return instance_name
+    instance_index = entity_type_dict.setdefault(parent_entity.name, 1)
+    entity_type_dict[parent_entity.name] = instance_index + 1
+    return parent_entity.name + str(instance_index), instance_index
 
 
-def add_data_entity_instance(
+def data_entity_quads(
     kg: Graph,
     data: Entity,
     top_level_kg: Graph,
     top_level_schema_namespace: Namespace,
     data_entity: DataEntity,
-) -> None:
+) -> List[Tuple]:
     """
-    Adds data entity instance to kg with the necessary relations
+    Collects the quads that represent the given data entity with its necessary relations
     Args:
-        kg: Graph object to add to
+        kg: Graph object that the quads are destined for
         data: object representing top-level DataEntity class in KG
         top_level_kg: KG corresponding to the top-level KG schema
         top_level_schema_namespace: namespace of the top-level KG schema
-        data_entity: data entity to add
+        data_entity: data entity to collect quads for
+
+    Returns:
+        List[Tuple]: contains quads of the form (subject, predicate, object, kg)
     """
-    add_instance(kg, data_entity)
+    quads = []
+    if data_entity.parent_entity and (data_entity.iri, None, None) not in kg:
+        quads.append((data_entity.iri, RDF.type, data_entity.parent_entity.iri, kg))
 
     if data_entity.has_source:
         has_source_iri, range_iri = get_first_query_result_if_exists(
@@ -141,32 +146,88 @@ def add_data_entity_instance(
             datatype=range_iri,
         )
 
-        add_literal(kg, data_entity, has_source_iri, source_literal)
+        quads.append((data_entity.iri, URIRef(has_source_iri), source_literal, kg))
 
     if data_entity.has_data_structure:
-        add_relation(
-            kg,
-            data_entity,
-            top_level_schema_namespace.hasDataStructure,
-            Entity(data_entity.has_data_structure),
+        quads.append(
+            (
+                data_entity.iri,
+                top_level_schema_namespace.hasDataStructure,
+                Entity(data_entity.has_data_structure).iri,
+                kg,
+            )
         )
 
     if data_entity.has_data_semantics:
-        add_relation(
-            kg,
-            data_entity,
-            top_level_schema_namespace.hasDataSemantics,
-            Entity(data_entity.has_data_semantics),
+        quads.append(
+            (
+                data_entity.iri,
+                top_level_schema_namespace.hasDataSemantics,
+                Entity(data_entity.has_data_semantics).iri,
+                kg,
+            )
         )
 
     if data_entity.has_reference:
-        add_relation(
-            kg,
-            data_entity,
-            top_level_schema_namespace.hasReference,
-            Entity(data_entity.has_reference),
+        quads.append(
+            (
+                data_entity.iri,
+                top_level_schema_namespace.hasReference,
+                Entity(data_entity.has_reference).iri,
+                kg,
+            )
         )
 
+    return quads
+
+
+def add_data_entity_instance(
+    kg: Graph,
+    data: Entity,
+    top_level_kg: Graph,
+    top_level_schema_namespace: Namespace,
+    data_entity: DataEntity,
+) -> None:
+    """
+    Adds data entity instance to kg with the necessary relations
+    Args:
+        kg: Graph object to add to
+        data: object representing top-level DataEntity class in KG
+        top_level_kg: KG corresponding to the top-level KG schema
+        top_level_schema_namespace: namespace of the top-level KG schema
+        data_entity: data entity to add
+    """
+    kg.addN(data_entity_quads(kg, data, top_level_kg, top_level_schema_namespace, data_entity))
+
+
+def add_and_attach_referenced_data_entity(
+    kg: Graph,
+    data: Entity,
+    top_level_kg: Graph,
+    top_level_schema_namespace: Namespace,
+    referenced_data_entity: DataEntity,
+    referencing_data_entity: DataEntity,
+    relation: URIRef,
+    task_entity: Task,
+) -> None:
+    """
+    Adds a data entity instance together with a second data entity that references it,
+    attaches the referencing one to the given task, and writes all resulting triples in one batched insertion
+    Args:
+        kg: Graph object to add to
+        data: object representing top-level DataEntity class in KG
+        top_level_kg: KG corresponding to the top-level KG schema
+        top_level_schema_namespace: namespace of the top-level KG schema
+        referenced_data_entity: data entity that is referenced by referencing_data_entity
+        referencing_data_entity: data entity to attach to the given task
+        relation: IRI of relation between the task and referencing_data_entity
+        task_entity: task to attach referencing_data_entity to
+    """
+    quads = data_entity_quads(kg, data, top_level_kg, top_level_schema_namespace, referenced_data_entity)
+    quads += data_entity_quads(kg, data, top_level_kg, top_level_schema_namespace, referencing_data_entity)
+    quads.append((task_entity.iri, URIRef(relation), referencing_data_entity.iri, kg))
+    kg.addN(quads)
+
 
 def add_and_attach_data_entity(
     kg: Graph,
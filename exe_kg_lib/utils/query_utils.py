@@ -3,21 +3,52 @@
 
 from typing import Callable, List, Optional, Tuple
 
-from rdflib import Graph, Namespace, URIRef, query
+from rdflib import OWL, RDF, RDFS, Graph, Namespace, URIRef, query
+from rdflib.plugins.sparql import prepareQuery
 
 from ..classes.entity import Entity
 
+# queries prepared once at import time, so repeated calls skip rdflib's SPARQL parsing and planning
+# namespace-specific terms are passed per call via initBindings
+_ENTITY_PARENT_QUERY = prepareQuery(
+    "SELECT ?t WHERE { ?entity rdf:type ?t . ?t rdfs:subClassOf* ?upper_class . }",
+    initNs={"rdf": RDF, "rdfs": RDFS},
+)
+_DATA_ENTITY_REFERENCE_QUERY = prepareQuery("SELECT ?r WHERE { ?entity ?has_reference ?r . }")
+_METHOD_BY_TASK_QUERY = prepareQuery(
+    "SELECT ?m WHERE { ?task ?m_property ?m . ?m_property rdfs:subPropertyOf* ?has_method . }",
+    initNs={"rdfs": RDFS},
+)
+_PIPELINE_INFO_QUERY = prepareQuery(
+    "SELECT ?p ?i ?t WHERE { ?p rdf:type ?pipeline_class ; ?has_input_data_path ?i ; ?has_start_task ?t . }",
+    initNs={"rdf": RDF},
+)
+
+
+def get_namespace_by_prefix(kg: Graph, namespace_prefix: str) -> Namespace:
+    """
+    Retrieves the namespace that is bound to the given prefix in the given KG
+    Args:
+        kg: Graph object with bound namespaces
+        namespace_prefix: prefix to search for
+
+    Returns:
+        Namespace: namespace corresponding to the given prefix
+    """
+    for prefix, namespace_iri in kg.namespaces():
+        if prefix == namespace_prefix:
+            return Namespace(namespace_iri)
+
+    raise ValueError(f"Namespace prefix {namespace_prefix} is not bound to the given KG")
+
 
 def query_method_parent_classes(kg, method_iri):
-    return kg.query(
-        f"SELECT ?c WHERE {{ ?method rdfs:subClassOf ?c . }}",
-        initBindings={"method": URIRef(method_iri)},
-    )
+    return [(parent_class_iri,) for parent_class_iri in kg.objects(URIRef(method_iri), RDFS.subClassOf)]
 
 
 def query_entity_parent_iri(kg, entity_iri: str, upper_class_uri_ref: URIRef):
     return kg.query(
-        f"SELECT ?t WHERE {{ ?entity rdf:type ?t ." f"                   ?t rdfs:subClassOf* ?upper_class .}}",
+        _ENTITY_PARENT_QUERY,
         initBindings={
             "entity": URIRef(entity_iri),
             "upper_class": upper_class_uri_ref,
@@ -26,19 +57,21 @@ def query_entity_parent_iri(kg, entity_iri: str, upper_class_uri_ref: URIRef):
 
 
 def query_data_entity_reference_iri(kg, namespace_prefix, entity_iri: str):
+    namespace = get_namespace_by_prefix(kg, namespace_prefix)
     return kg.query(
-        f"SELECT ?r WHERE {{ ?entity {namespace_prefix}:hasReference ?r . }}",
+        _DATA_ENTITY_REFERENCE_QUERY,
         initBindings={
             "entity": URIRef(entity_iri),
+            "has_reference": namespace.hasReference,
         },
     )
 
 
 def query_method_iri_by_task_iri(kg, namespace_prefix, task_iri: str):
+    namespace = get_namespace_by_prefix(kg, namespace_prefix)
     return kg.query(
-        f"SELECT ?m WHERE {{ ?task ?m_property ?m ."
-        f"                   ?m_property rdfs:subPropertyOf* {namespace_prefix}:hasMethod .}}",
-        initBindings={"task": URIRef(task_iri)},
+        _METHOD_BY_TASK_QUERY,
+        initBindings={"task": URIRef(task_iri), "has_method": namespace.hasMethod},
     )
 
 
@@ -54,59 +87,117 @@ def get_first_query_result_if_exists(query_method: Callable, *args) -> Optional[
     return query_result
 
 
-def get_data_properties_by_entity_iri(entity_iri: str, kg: Graph) -> query.Result:
-    return kg.query(
-        "\nSELECT ?p ?r WHERE {?p rdfs:domain ?entity_iri . "
-        "?p rdfs:range ?r . "
-        "?p rdf:type owl:DatatypeProperty . }",
-        initBindings={"entity_iri": URIRef(entity_iri)},
-    )
+def get_data_properties_by_entity_iri(entity_iri: str, kg: Graph) -> List[Tuple[URIRef, URIRef]]:
+    results = []
+    for property_iri in kg.subjects(RDFS.domain, URIRef(entity_iri)):
+        if (property_iri, RDF.type, OWL.DatatypeProperty) not in kg:
+            continue
+        for range_iri in kg.objects(property_iri, RDFS.range):
+            results.append((property_iri, range_iri))
 
+    return results
 
-def get_method_properties_and_methods(input_kg, namespace_prefix, entity_parent_iri: str) -> query.Result:
-    return input_kg.query(
-        "\nSELECT ?p ?m WHERE {?p rdfs:domain ?entity_iri . "
-        "?p rdfs:range ?m . "
-        "?m rdfs:subClassOf " + namespace_prefix + ":AtomicMethod . }",
-        initBindings={"entity_iri": URIRef(entity_parent_iri)},
-    )
 
+def get_method_properties_and_methods(
+    input_kg, namespace_prefix, entity_parent_iri: str
+) -> List[Tuple[URIRef, URIRef]]:
+    namespace = get_namespace_by_prefix(input_kg, namespace_prefix)
+    atomic_method_iri = namespace.AtomicMethod
 
-def get_input_properties_and_inputs(input_kg, namespace_prefix, entity_parent_iri: str) -> query.Result:
-    return input_kg.query(
-        "\nSELECT ?p ?m ?s WHERE {?p rdfs:domain ?entity_iri . "
-        "?p rdfs:range ?m ."
-        "?p rdfs:subPropertyOf " + namespace_prefix + ":hasInput ."
-        "?m rdfs:subClassOf " + namespace_prefix + ":DataEntity . "
-        "?m " + namespace_prefix + ":hasDataStructure ?s . }",
-        initBindings={"entity_iri": URIRef(entity_parent_iri)},
-    )
+    results = []
+    for property_iri in input_kg.subjects(RDFS.domain, URIRef(entity_parent_iri)):
+        for method_iri in input_kg.objects(property_iri, RDFS.range):
+            if (method_iri, RDFS.subClassOf, atomic_method_iri) in input_kg:
+                results.append((property_iri, method_iri))
 
+    return results
+
+
+def _get_in_out_properties_and_data_entities(
+    input_kg, namespace_prefix, entity_parent_iri: str, in_out_property_name: str
+) -> List[Tuple[URIRef, URIRef, URIRef]]:
+    """
+    Retrieves the input or output properties attached to the given entity in the KG schema,
+    together with the corresponding data entities and their data structures
+    Args:
+        input_kg: Graph object to search in
+        namespace_prefix: prefix of the top-level KG schema's namespace
+        entity_parent_iri: IRI of the entity that the properties are attached to
+        in_out_property_name: name of the top-level property to match, "hasInput" or "hasOutput"
+
+    Returns:
+        List[Tuple[URIRef, URIRef, URIRef]]: contains rows of property IRI, data entity IRI and data structure IRI
+    """
+    namespace = get_namespace_by_prefix(input_kg, namespace_prefix)
+    in_out_property_iri = URIRef(namespace + in_out_property_name)
+    data_entity_iri = namespace.DataEntity
+    has_data_structure_iri = namespace.hasDataStructure
+
+    results = []
+    for property_iri in input_kg.subjects(RDFS.domain, URIRef(entity_parent_iri)):
+        if (property_iri, RDFS.subPropertyOf, in_out_property_iri) not in input_kg:
+            continue
+        for in_out_entity_iri in input_kg.objects(property_iri, RDFS.range):
+            if (in_out_entity_iri, RDFS.subClassOf, data_entity_iri) not in input_kg:
+                continue
+            for data_structure_iri in input_kg.objects(in_out_entity_iri, has_data_structure_iri):
+                results.append((property_iri, in_out_entity_iri, data_structure_iri))
+
+    return results
 
-def get_output_properties_and_outputs(input_kg, namespace_prefix, entity_parent_iri: str) -> query.Result:
-    return input_kg.query(
-        "\nSELECT ?p ?m ?s WHERE {?p rdfs:domain ?entity_iri . "
-        "?p rdfs:range ?m ."
-        "?p rdfs:subPropertyOf " + namespace_prefix + ":hasOutput ."
-        "?m rdfs:subClassOf " + namespace_prefix + ":DataEntity . "
-        "?m " + namespace_prefix + ":hasDataStructure ?s . }",
-        initBindings={"entity_iri": URIRef(entity_parent_iri)},
-    )
+
+def get_input_properties_and_inputs(
+    input_kg, namespace_prefix, entity_parent_iri: str
+) -> List[Tuple[URIRef, URIRef, URIRef]]:
+    return _get_in_out_properties_and_data_entities(input_kg, namespace_prefix, entity_parent_iri, "hasInput")
+
+
+def get_output_properties_and_outputs(
+    input_kg, namespace_prefix, entity_parent_iri: str
+) -> List[Tuple[URIRef, URIRef, URIRef]]:
+    return _get_in_out_properties_and_data_entities(input_kg, namespace_prefix, entity_parent_iri, "hasOutput")
 
 
 def query_pipeline_info(kg, namespace_prefix):
+    namespace = get_namespace_by_prefix(kg, namespace_prefix)
     return kg.query(
-        f"\nSELECT ?p ?i ?t WHERE {{?p rdf:type {namespace_prefix}:Pipeline ;"
-        f"                          {namespace_prefix}:hasInputDataPath ?i ;"
-        f"                          {namespace_prefix}:hasStartTask ?t . }}"
+        _PIPELINE_INFO_QUERY,
+        initBindings={
+            "pipeline_class": namespace.Pipeline,
+            "has_input_data_path": namespace.hasInputDataPath,
+            "has_start_task": namespace.hasStartTask,
+        },
     )
 
 
-def get_subclasses_of(class_iri: str, kg: Graph) -> query.Result:
-    return kg.query(
-        "\nSELECT ?t WHERE {?t rdfs:subClassOf ?class_iri . }",
-        initBindings={"class_iri": class_iri},
-    )
+def materialize_subclass_closure(kg: Graph) -> None:
+    """
+    Materializes the transitive closure of rdfs:subClassOf in the given KG
+    i.e. adds (x rdfs:subClassOf z) for every ancestor z of every class x
+    This turns costly rdfs:subClassOf* property-path queries into direct triple lookups
+    Args:
+        kg: Graph object to modify
+    """
+    parents_by_class = {}
+    for child, parent in kg.subject_objects(RDFS.subClassOf):
+        parents_by_class.setdefault(child, set()).add(parent)
+
+    for child, parents in parents_by_class.items():
+        ancestors = set(parents)
+        worklist = list(parents)
+        while worklist:
+            ancestor = worklist.pop()
+            for grandparent in parents_by_class.get(ancestor, ()):
+                if grandparent not in ancestors:
+                    ancestors.add(grandparent)
+                    worklist.append(grandparent)
+
+        for ancestor in ancestors:
+            kg.add((child, RDFS.subClassOf, ancestor))
+
+
+def get_subclasses_of(class_iri: str, kg: Graph) -> List[Tuple[URIRef]]:
+    return [(subclass_iri,) for subclass_iri in kg.subjects(RDFS.subClassOf, URIRef(class_iri))]
 
 
 def get_data_properties_plus_inherited_by_class_iri(kg: Graph, entity_iri: str) -> List:
@@ -152,6 +243,28 @@ def get_pipeline_and_first_task_iri(kg: Graph, namespace_prefix: str) -> Tuple[s
     return str(pipeline_iri), str(input_data_path), str(task_iri)
 
 
+def get_ordered_task_iris(kg: Graph, namespace: Namespace, first_task_iri: str) -> List[str]:
+    """
+    Retrieves the IRIs of a pipeline's tasks in execution order by following
+    the hasNextTask links, starting from the given first task
+    Args:
+        kg: Graph object to use when querying
+        namespace: namespace of the top-level KG schema
+        first_task_iri: IRI of the pipeline's first task
+
+    Returns:
+        List[str]: task IRIs in execution order
+    """
+    has_next_task_iri = namespace.hasNextTask
+    task_iris = []
+    next_task_iri = URIRef(first_task_iri)
+    while next_task_iri is not None:
+        task_iris.append(str(next_task_iri))
+        next_task_iri = next(kg.objects(next_task_iri, has_next_task_iri), None)
+
+    return task_iris
+
+
 def get_method_by_task_iri(
     kg: Graph,
     namespace_prefix: str,
@@ -0,0 +1,65 @@
+# Copyright (c) 2022 Robert Bosch GmbH
+# SPDX-License-Identifier: AGPL-3.0
+
+import os
+
+from rdflib import Graph
+
+SCHEMATA_DIR = os.path.join(os.path.dirname(__file__), "..", "schemata")
+
+# "path" points to the N-Triples copy of each schema bundled in the package by bundle_schemata()
+# "fallback_path" is the remote Turtle original, parsed only when the bundled copy is missing
+# kept free of package-relative imports so the build script can load this module standalone
+KG_SCHEMAS = {
+    "Data Science": {
+        "path": "pkg://exe_kg_lib.schemata/ds_exeKGOntology.nt",
+        "fallback_path": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/ds_exeKGOntology.ttl",
+        "namespace": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/ds_exeKGOntology.ttl#",
+        "namespace_prefix": "ds",
+    },
+    "Visualization": {
+        "path": "pkg://exe_kg_lib.schemata/visu_exeKGOntology.nt",
+        "fallback_path": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/visu_exeKGOntology.ttl",
+        "namespace": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/visu_exeKGOntology.ttl#",
+        "namespace_prefix": "visu",
+    },
+    "Statistics": {
+        "path": "pkg://exe_kg_lib.schemata/stats_exeKGOntology.nt",
+        "fallback_path": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/stats_exeKGOntology.ttl",
+        "namespace": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/stats_exeKGOntology.ttl#",
+        "namespace_prefix": "stats",
+    },
+    "Machine Learning": {
+        "path": "pkg://exe_kg_lib.schemata/ml_exeKGOntology.nt",
+        "fallback_path": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/ml_exeKGOntology.ttl",
+        "namespace": "https://raw.githubusercontent.com/nsai-uio/ExeKGOntology/main/ml_exeKGOntology.ttl#",
+        "namespace_prefix": "ml",
+    },
+}
+
+
+def _bundled_schema_path(schema_info: dict) -> str:
+    return os.path.join(SCHEMATA_DIR, schema_info["path"].rsplit("/", 1)[1])
+
+
+def schemata_bundled() -> bool:
+    """
+    Checks whether every KG schema has a bundled N-Triples file in the package
+    Returns:
+        bool: True if all bundled schema files exist
+    """
+    return all(os.path.isfile(_bundled_schema_path(schema_info)) for schema_info in KG_SCHEMAS.values())
+
+
+def bundle_schemata() -> None:
+    """
+    Fetches the remote Turtle definition of each KG schema and stores it in the package's schemata directory as N-Triples
+    N-Triples is used because its line-based grammar makes rdflib's parsing much faster than Turtle's
+    """
+    for schema_name, schema_info in KG_SCHEMAS.items():
+        kg = Graph()
+        kg.parse(schema_info["fallback_path"], format="n3")
+
+        file_path = _bundled_schema_path(schema_info)
+        kg.serialize(destination=file_path, format="nt", encoding="utf-8")
+        print(f"Bundled {schema_name} KG schema in {file_path}")
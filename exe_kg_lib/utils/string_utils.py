@@ -2,6 +2,23 @@
 # SPDX-License-Identifier: AGPL-3.0
 
 import re
+import sys
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def local_name(iri: str) -> str:
+    """
+    Extracts the local name of the given IRI, i.e. the part after the last "#"
+    Results are cached and interned, since the same schema IRIs recur on the KG-construction path
+    and the local names are used as dict keys
+    Args:
+        iri: IRI to parse
+
+    Returns:
+        str: local name of the IRI
+    """
+    return sys.intern(iri.rpartition("#")[2])
 
 
 def camel_to_snake(text: str) -> str:
@@ -17,13 +34,16 @@ def camel_to_snake(text: str) -> str:
     return re.sub("([a-z0-9])([A-Z])", r"\1_\2", text).lower()
 
 
+@lru_cache(maxsize=4096)
 def property_name_to_field_name(property_name: str) -> str:
     """
     Extracts property name from IRI and converts it to snake-case
+    The result is cached and interned since the same schema properties recur while
+    parsing a KG, and the converted names are used as attribute/dict keys
     Args:
         property_name: IRI to parse
 
     Returns:
         str: converted string
     """
-    return camel_to_snake(property_name.split("#")[1])
+    return sys.intern(camel_to_snake(local_name(property_name)))